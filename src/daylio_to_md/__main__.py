@@ -1,4 +1,5 @@
 import sys
+import typing
 import logging
 
 from daylio_to_md.journal_entry import EntryBuilder
@@ -7,12 +8,17 @@ from daylio_to_md.config import parse_console
 from daylio_to_md.librarian import Librarian, CannotAccessJournalError, EmptyJournalError
 
 
-def main():
-    """Parse a Daylio CSV into an Obsidian-compatible .MD file"""
+def main(args: typing.Optional[typing.List[str]] = None):
+    """
+    Parse a Daylio CSV into an Obsidian-compatible .MD file
+    :param args: (opt.) console arguments to use instead of :attr:`sys.argv`, e.g. when called from another script
+    """
     # Compile global settings
     # ---
     # Read arguments from console and update the global_settings accordingly
-    cli_options = parse_console(sys.argv[1:])  # [1:] skips the program name, such as ["foo.py", ...]
+    if args is None:
+        args = sys.argv[1:]  # [1:] skips the program name, such as ["foo.py", ...]
+    cli_options = parse_console(args)
 
     # And now let's start processing
     # ---
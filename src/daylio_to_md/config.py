@@ -27,6 +27,7 @@ from __future__ import annotations
 # https://www.doc.ic.ac.uk/~nuric/posts/coding/how-to-handle-configuration-in-python/
 
 import argparse
+import functools
 import logging
 from collections import namedtuple
 from typing import List, Any
@@ -55,6 +56,14 @@ def parse_console(args: List[Any]) -> argparse.Namespace:
     Parses the list as if it were a list of arguments given to a script.
     :param args: either console arguments from sys.argv or spoofed ones
     """
+    return _console_parser().parse_args(args=args)
+
+
+@functools.lru_cache(maxsize=None)
+def _console_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser only once - parse_args() does not modify it, so it can be reused by every parse_console() call.
+    """
     console_arguments = argparse.ArgumentParser(
         fromfile_prefix_chars="@",
         prog="Daylio to Obsidian Parser",
@@ -150,4 +159,4 @@ def parse_console(args: List[Any]) -> argparse.Namespace:
         help="Set delimiter for activities in Daylio .csv, e.g: football | chess"
     )
 
-    return console_arguments.parse_args(args=args)
+    return console_arguments
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+import types
 from typing import List
 
 from daylio_to_md import errors
 
 DEFAULT_DAYLIO_MOOD_GROUPS = "rad good neutral bad awful"
+# Read-only view, so no Moodverse can accidentally overwrite the standard mood set it copies from
+_DEFAULT_MOODS = types.MappingProxyType({mood: mood for mood in DEFAULT_DAYLIO_MOOD_GROUPS.split()})
 
 
 class ErrorMsg(errors.ErrorMsgBase):
@@ -54,13 +57,12 @@ class Moodverse:
     :param dict[str, List[str]] moods_to_process: data structure with moods to be added onto the default ones.
     :raise MoodNotFoundError: when trying to access an unknown mood.
     """
-    __slots__ = ('__known_moods', '__logger', '__custom_moods')
+    __slots__ = ('__known_moods', '__custom_moods')
+    __logger = logging.getLogger("Moodverse")
     __known_moods: dict[str, str]
     __custom_moods: dict[str, str]
 
     def __init__(self, moods_to_process: dict[str, List[str]] = None):
-        self.__logger = logging.getLogger(self.__class__.__name__)
-
         # DEFAULT PART OF INIT
         # --------------------
         # Build a minimal-viable mood set with these five mood groups
@@ -76,9 +78,8 @@ class Moodverse:
         # └── known moods of 'awful' group
         #     └── awful
 
-        # I know this line is shitty, but I don't have access to const or immutable lists, so I rely on str.strip()
-        # When I tried using mutable dicts or lists, the problem was that something in my code kept overwriting it
-        self.__known_moods = {mood: mood for mood in DEFAULT_DAYLIO_MOOD_GROUPS.split()}
+        # Every instance gets its own copy of the standard mood set, because custom moods are added onto it later
+        self.__known_moods = dict(_DEFAULT_MOODS)
         self.__custom_moods = {}
 
         # We can stop here and be content with our "default" / "standard" mood-set if user did not pass a custom one
@@ -135,21 +136,15 @@ class Moodverse:
         # By itering on the dictionary of known mood groups (which are always Daylio-compliant), we skip unknown groups.
         # Unknown moods are OK, but they need to be within a known GROUP.
         for group in DEFAULT_DAYLIO_MOOD_GROUPS.split():
-            # Set:
-            # - gets rid of duplicates
+            # Checking against the known mood dict while inserting:
+            # - gets rid of duplicates, also within the same group
             # - ignores values already in the known mood dict
             # - ignores non-strings or empty strings
-            try:
-                sanitised_moods = set(
-                    mood
-                    for mood in moods_to_process[group]
-                    if isinstance(mood, str) and mood and mood not in self.__known_moods
-                )
-                for mood in sanitised_moods:
+            # and keeps the moods in the order user listed them.
+            for mood in moods_to_process.get(group, ()):
+                if isinstance(mood, str) and mood and mood not in self.__known_moods:
                     self.__known_moods[mood] = group
                     custom_moods_found[mood] = group
-            except KeyError:
-                pass
 
         # TODO: disallow duplicates in different mod groups - what colour to use if a mood is in more than one grup?
         return custom_moods_found
@@ -158,8 +153,11 @@ class Moodverse:
         return "{}({})".format(self.__class__.__name__, self.__known_moods)
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, Moodverse):
-            return self.__known_moods == other.get_moods
+        if not isinstance(other, Moodverse):
+            # let Python try the reflected comparison instead of silently returning None
+            return NotImplemented
+        # dict comparison already bails out early when the number of moods differs
+        return self.__known_moods == other.get_moods
 
     def __getitem__(self, item: str) -> str:
         """
@@ -1,3 +1,4 @@
+import functools
 import logging
 import sys
 from typing import Optional
@@ -11,25 +12,26 @@ class ColorHandler(logging.StreamHandler):
     RED = "31"
     WHITE = "0"
 
+    # We don't use white for any logging, to help distinguish from user print statements
+    # Built once with the class, not on every emitted record
+    # noinspection PyPep8
+    LEVEL_COLOR_MAP = {
+        logging.DEBUG: GRAY8,
+        logging.INFO: GRAY7,
+        logging.WARNING: ORANGE,
+        logging.ERROR: RED,
+        logging.CRITICAL: f"1;{RED}",  # Bold for critical errors
+    }
+    CSI = f"{chr(27)}["  # control sequence introducer
+
     # noinspection PyPep8
     def emit(self, record):
-        # We don't use white for any logging, to help distinguish from user print statements
-        # noinspection PyPep8
-        level_color_map = {
-            logging.DEBUG: self.GRAY8,
-            logging.INFO: self.GRAY7,
-            logging.WARNING: self.ORANGE,
-            logging.ERROR: self.RED,
-            logging.CRITICAL: f"1;{self.RED}",  # Bold for critical errors
-        }
-
-        csi = f"{chr(27)}["  # control sequence introducer
-        color = level_color_map.get(record.levelno, self.WHITE)
+        color = self.LEVEL_COLOR_MAP.get(record.levelno, self.WHITE)
 
         # Apply the formatter to format the log message
         formatted_msg = self.format(record)
 
-        self.stream.write(f"{csi}{color}m{formatted_msg}{csi}m\n")
+        self.stream.write(f"{self.CSI}{color}m{formatted_msg}{self.CSI}m\n")
 
 
 # Create a console handler for the root logger
@@ -47,6 +49,12 @@ logging.getLogger().addHandler(console_log_handler)
 logging.getLogger().setLevel(logging.INFO)
 
 
+@functools.lru_cache(maxsize=None)
+def _count_placeholders(message: str) -> int:
+    """Count the {} slots in a message. Messages are class-level constants, so each one is only scanned once."""
+    return message.count("{}")
+
+
 class ErrorMsgBase:
     """
     Used for common errors that will be logged by almost (if not all) loggers.
@@ -65,7 +73,7 @@ class ErrorMsgBase:
         Insert the args into an error message. If the error message expects n variables, provide n arguments.
         Returns a string with the already filled out message.
         """
-        expected_args = message.count("{}")
+        expected_args = _count_placeholders(message)
 
         if len(args) != expected_args:
             logging.getLogger(__name__).warning(
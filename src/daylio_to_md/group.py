@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 
 import io
 import typing
-import logging
+import functools
 import datetime
 
 from daylio_to_md import journal_entry
@@ -52,6 +52,26 @@ MAIN
 ---------------------------------------------------------------------------------------------------------------------"""
 
 
+@functools.lru_cache(maxsize=None)
+def _build_front_matter(front_matter_tags: typing.Tuple[str, ...]) -> str:
+    """
+    Build the YAML front-matter placed at the beginning of each note.
+    Every day of a journal is usually written with the same tags, so the result is cached per tuple of tags.
+    :param front_matter_tags: Tags in the YAML front-matter of each note
+    :returns: front-matter block, or an empty string if none of the tags is valid.
+    """
+    # when appending file frontmatter_tags at the beginning of the file, discard any duplicates or falsy strings
+    # sorted() is used to have a deterministic order, set() was random, so I couldn't properly test the output
+    valid_tags = sorted(set(val for val in front_matter_tags if val))
+    if not valid_tags:
+        return ""
+    # why '\n' instead of os.linesep?
+    # > Do not use os.linesep as a line terminator when writing files opened in text mode (the default);
+    # > use a single '\n' instead, on all platforms.
+    # https://docs.python.org/3.10/library/os.html#os.linesep
+    return "---" + "\n" + "tags: " + ",".join(valid_tags) + "\n" + "---" + "\n" * 2
+
+
 @dataclass(frozen=True)
 class EntriesFromBuilder:
     """
@@ -85,6 +105,8 @@ class EntriesFrom(utils.Core):
     :param entries_builder: Builder configured to create new :class:`Entry` objects
     :param mood_set: Use custom :class:`Moodverse` or default if not provided.
     """
+    __slots__ = ('__front_matter_tags', '__entries_builder', '__known_entries', '__known_moods',
+                 '__date_string', '_initialised')
     _instances: dict[datetime.date, EntriesFrom] = {}
 
     def __new__(cls,
@@ -115,14 +137,15 @@ class EntriesFrom(utils.Core):
         if hasattr(self, "_initialised"):
             return
 
-        self.__logger = logging.getLogger(self.__class__.__name__)
         super().__init__(utils.guess_date_type(date))
 
         # All good - initialise
-        self.__front_matter_tags = front_matter_tags
+        # tuple makes the tags hashable, so the front matter built from them can be cached and shared between days
+        self.__front_matter_tags = tuple(front_matter_tags)
         self.__entries_builder = entries_builder
         self.__known_entries: dict[datetime.time, Entry] = {}
         self.__known_moods: Moodverse = mood_set
+        self.__date_string: typing.Optional[str] = None
 
         self._initialised = True
 
@@ -137,14 +160,9 @@ class EntriesFrom(utils.Core):
         :param line: a dictionary of strings. Required keys: mood, activities, note_title & note.
         """
         # TODO: test case this
-        # Try accessing the minimum required keys
-        for key in ["time", "mood"]:
-            try:
-                line[key]
-            except KeyError as err:
-                raise IncompleteDataRow(key) from err
-            # is it empty then, maybe?
-            if not line[key]:
+        # Check the minimum required keys - a missing key and an empty value are equally useless
+        for key in ("time", "mood"):
+            if not line.get(key):
                 raise IncompleteDataRow(key)
 
         # TODO: date mismatch - this object has a different date than the full_date in line
@@ -175,10 +193,10 @@ class EntriesFrom(utils.Core):
         """
         time_lookup: datetime.time = utils.guess_time_type(item)
 
-        if time_lookup in self.__known_entries:
-            return self.__known_entries[time_lookup]
-        else:
-            raise EntryMissingError(time_lookup, self.date)
+        entry = self.__known_entries.get(time_lookup)
+        if entry is not None:
+            return entry
+        raise EntryMissingError(time_lookup, self.date)
 
     def __setitem__(self, key: typing.Union[datetime.time, str, typing.List[int], typing.List[str]], value: Entry):
         """
@@ -205,6 +223,27 @@ class EntriesFrom(utils.Core):
                 continue
             self[item.time] = item
 
+    def render(self) -> str:
+        """
+        Build the Markdown contents of the whole file for this day: front matter, then every known :class:`Entry`.
+        :returns: file contents as one string, ready to be written somewhere.
+        """
+        parts = []
+        # THE BEGINNING OF THE FILE
+        front_matter = _build_front_matter(self.__front_matter_tags)
+        if front_matter:
+            parts.append(front_matter)
+
+        # THE ACTUAL ENTRY CONTENTS
+        # Each Entry object renders itself, followed by an empty line
+        for entry in self.__known_entries.values():
+            rendered_entry = entry.render()
+            if rendered_entry:
+                parts.append(rendered_entry)
+                parts.append("\n" * 2)
+
+        return ''.join(parts)
+
     def output(self, stream: io.IOBase | typing.IO) -> int:
         """
         Write entry contents of all :class:`Entry` known directly into the provided buffer stream.
@@ -217,29 +256,7 @@ class EntriesFrom(utils.Core):
         if not stream.writable():
             raise utils.StreamError
 
-        chars_written = 0
-        # THE BEGINNING OF THE FILE
-        # when appending file frontmatter_tags at the beginning of the file, discard any duplicates or falsy strings
-        # sorted() is used to have a deterministic order, set() was random, so I couldn't properly test the output
-        valid_tags = sorted(set(val for val in self.__front_matter_tags if val))
-        if valid_tags:
-            # why '\n' instead of os.linesep?
-            # > Do not use os.linesep as a line terminator when writing files opened in text mode (the default);
-            # > use a single '\n' instead, on all platforms.
-            # https://docs.python.org/3.10/library/os.html#os.linesep
-            chars_written += stream.write("---" + "\n")
-            chars_written += stream.write("tags: " + ",".join(valid_tags) + "\n")
-            chars_written += stream.write("---" + "\n" * 2)
-
-        # THE ACTUAL ENTRY CONTENTS
-        # Each DatedEntry object now appends its contents into the stream
-        for entry in self.__known_entries.values():
-            # write returns the number of characters successfully written
-            # https://docs.python.org/3/library/io.html#io.TextIOBase.write
-            if entry.output(stream) > 0:
-                chars_written += stream.write("\n" * 2)
-
-        return chars_written
+        return stream.write(self.render())
 
     @property
     def known_entries(self):
@@ -264,7 +281,10 @@ class EntriesFrom(utils.Core):
 
     def __str__(self):
         """:return: the date that groups entries written on that day in ``YYYY-MM-DD`` format"""
-        return self.uid.strftime("%Y-%m-%d")
+        # The date of a group never changes, so it only needs to be formatted once
+        if self.__date_string is None:
+            self.__date_string = self.uid.strftime("%Y-%m-%d")
+        return self.__date_string
 
     def __len__(self):
         """:return: how many entries it groups on that particular date"""
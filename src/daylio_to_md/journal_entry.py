@@ -11,6 +11,7 @@ Here's a quick breakdown of what is the specialisation of this file in the journ
 from __future__ import annotations
 
 import io
+import sys
 import logging
 import typing
 import datetime
@@ -103,6 +104,11 @@ class Entry(utils.Core):
     :raise InvalidTimeError: if the passed time argument cannot be coerced into :class:`datetime.time`
     :raise NoMoorError: if mood is falsy
     """
+    # One Entry is created per CSV row, so skip the per-instance __dict__
+    __slots__ = ('__csv_delimiter', '__header_multiplier', '__tag_activities', '__prefix', '__suffix',
+                 '__mood', '__activities', '__title', '__note')
+    # Shared by all instances - looking the logger up again for every row is wasted work
+    __logger = logging.getLogger("Entry")
 
     def __init__(self,
                  time: typing.Union[datetime.time, str, typing.List[str], typing.List[int]],
@@ -117,7 +123,6 @@ class Entry(utils.Core):
                  suffix: str = EntryBuilder.suffix,
                  mood_set: Moodverse = Moodverse()):
 
-        self.__logger = logging.getLogger(self.__class__.__name__)
         self.__csv_delimiter = csv_delimiter
         self.__header_multiplier = header_multiplier
         self.__tag_activities = tag_activities
@@ -140,17 +145,20 @@ class Entry(utils.Core):
         if mood not in mood_set.get_moods:
             self.__logger.warning(ErrorMsg.INVALID_MOOD.format(mood))
         # Warning is enough, it just disables colouring so not big of a deal
-        self.__mood = mood
+        # Moods and activities come from a small vocabulary repeated on every row, so keep only one copy of each string
+        self.__mood = sys.intern(mood)
 
         # Processing other, optional properties
         # ---
         # Process activities
-        self.__activities = []
+        # Entries never change their activities after parsing, so a tuple is enough
+        self.__activities = ()
         if activities:
             working_array = utils.strip_and_get_truthy(activities, self.__csv_delimiter)
             if len(working_array) > 0:
-                for activity in working_array:
-                    self.__activities.append(utils.slugify(activity, self.__tag_activities))
+                self.__activities = tuple(
+                    sys.intern(utils.slugify(activity, self.__tag_activities)) for activity in working_array
+                )
             else:
                 self.__logger.warning(ErrorMsg.WRONG_ACTIVITIES.format(activities))
         # Process title
@@ -158,6 +166,30 @@ class Entry(utils.Core):
         # Process note
         self.__note = utils.slice_quotes(note) if note else None
 
+    def render(self) -> str:
+        """
+        Build the Markdown representation of this entry.
+        :returns: entry contents as one string, ready to be written somewhere.
+        """
+        # Collect all parts first and join them once - cheaper than concatenating or writing them one by one
+        parts = []
+        # HEADER OF THE NOTE
+        # e.g. "## great | 11:00 AM | Oh my, what a night!"
+        # header_multiplier is an int that multiplies the # to create headers in markdown
+        parts.append(self.__header_multiplier * "#" + ' ' + self.__mood + ' | ' + self.time.strftime("%H:%M"))
+        if self.__title is not None:
+            parts.append(' | ' + self.__title)
+        # ACTIVITIES
+        # e.g. "bicycle skating pool swimming"
+        if self.__activities:
+            parts.append("\n" + ' '.join(self.__activities))
+        # NOTE
+        # e.g. "Went swimming this evening."
+        if self.__note is not None:
+            parts.append("\n" + self.__note)
+
+        return ''.join(parts)
+
     def output(self, stream: io.IOBase | typing.IO) -> int:
         """
         Write entry contents directly into the provided buffer stream.
@@ -170,34 +202,14 @@ class Entry(utils.Core):
         if not stream.writable():
             raise utils.StreamError
 
-        chars_written = 0
-        # HEADER OF THE NOTE
-        # e.g. "## great | 11:00 AM | Oh my, what a night!"
-        # header_multiplier is an int that multiplies the # to create headers in markdown
-        header_elements = [
-            self.__header_multiplier * "#" + ' ' + self.__mood,
-            self.time.strftime("%H:%M"),
-            self.__title
-        ]
-        header = ' | '.join([el for el in header_elements if el is not None])
-        chars_written += stream.write(header)
-        # ACTIVITIES
-        # e.g. "bicycle skating pool swimming"
-        if len(self.__activities) > 0:
-            chars_written += stream.write("\n" + ' '.join(self.__activities))
-        # NOTE
-        # e.g. "Went swimming this evening."
-        if self.__note is not None:
-            chars_written += stream.write("\n" + self.__note)
-
-        return chars_written
+        return stream.write(self.render())
 
     @property
     def mood(self) -> str:
         return self.__mood
 
     @property
-    def activities(self) -> typing.List[str]:
+    def activities(self) -> typing.Tuple[str, ...]:
         return self.__activities
 
     @property
@@ -89,6 +89,12 @@ def create_and_open(filename: str, mode: str) -> IO:
     return open(filename, mode, encoding="UTF-8")
 
 
+def write_file(filename: str, contents: str) -> int:
+    # TODO: maybe add the mode option to settings in argparse? write/append
+    with create_and_open(filename, 'w') as file:
+        return file.write(contents)
+
+
 # I've found a term that describes what this class does - it is a Director - even sounds similar to Librarian
 # https://refactoring.guru/design-patterns/builder
 class Librarian:
@@ -107,6 +113,7 @@ class Librarian:
     -------------------------
     TODO: add missing documentation
     """
+    __logger = logging.getLogger("Librarian")
 
     def __init__(self,
                  path_to_file: str,
@@ -122,7 +129,6 @@ class Librarian:
         :raises CannotAccessFileError: if any problems occur during accessing or decoding the CSV file.
         :raises EmptyJournalError: if the file does not produce any valid results after processing.
         """
-        self.__logger = logging.getLogger(self.__class__.__name__)
         self.__filepath = path_to_file
         self.__known_dates: dict[datetime.date, EntriesFrom] = {}
         self.__entries_from_builder = entries_from_builder
@@ -257,12 +263,16 @@ class Librarian:
         # Let DatedEntriesGroup handle the rest and increment the counter (True == 1)
         try:
             date = guess_date_type(line["full_date"])
-            entries_from_this_date = (self.__entries_from_builder.build(date, self.__mood_set))
+            # Daylio exports rows from the same day one after another, so most rows can reuse an already known group
+            # instead of going through the builder again
+            entries_from_this_date = self.__known_dates.get(date)
+            if entries_from_this_date is None:
+                entries_from_this_date = self.__entries_from_builder.build(date, self.__mood_set)
             entries_from_this_date.create_entry(line)
             # Overwriting existing keys is not a problem since EntriesFrom.__new__() returns the same object ID when
             # it is initialised with the same date parameter. Also, since we are type-casting date into datetime.date
             # identical dates will always be equal, so the same key-value pair will be returned by the dictionary.
-            self[date] = entries_from_this_date
+            self.__known_dates[date] = entries_from_this_date
         except (group.TriedCreatingDuplicateDatedEntryError,
                 group.IncompleteDataRow,
                 utils.InvalidDateError,
@@ -279,9 +289,8 @@ class Librarian:
             # "2022/11/09/2022-11-09.md"
             filename = str(known_date.date) + ".md"
             filepath = "/".join([self.__destination, str(known_date.date.year), str(known_date.date.month), filename])
-            # TODO: maybe add the mode option to settings in argparse? write/append
-            with create_and_open(filepath, 'w') as file:
-                known_date.output(file)
+            # Render the whole day in memory first, so the file gets a single write instead of one per line of text
+            write_file(filepath, known_date.render())
 
     def __getitem__(self, key: typing.Union[datetime.date, str, typing.List[str], typing.List[int]]) -> EntriesFrom:
         """
@@ -297,8 +306,9 @@ class Librarian:
         """
         date_lookup: datetime.date = guess_date_type(key)
 
-        if date_lookup in self.__known_dates:
-            return self.__known_dates[date_lookup]
+        entries_from = self.__known_dates.get(date_lookup)
+        if entries_from is not None:
+            return entries_from
         # TODO: custom exception like EntryMissingError
         raise KeyError
 
@@ -6,6 +6,7 @@ from __future__ import annotations
 import abc
 import csv
 import datetime
+import functools
 import json
 import logging
 import os
@@ -84,6 +85,8 @@ MAIN
 
 
 class Core:
+    __slots__ = ('__uid',)
+
     def __init__(self, uid):
         self.__uid = uid
 
@@ -104,25 +107,38 @@ class Core:
         return self.__uid
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"[^\w\-]+")
+_REPEATED_DASH_RE = re.compile(r"--+")
+
+
 def slugify(text: str, taggify: bool) -> str:
     # noinspection SpellCheckingInspection
     """
     Simple slugification function to transform text. Works on non-latin characters too.
     """
     logger = logging.getLogger(__name__)
-    text = str(text).lower().strip()  # get rid of trailing spaces left after splitting activities apart from one string
-    text = re.sub(re.compile(r"\s+"), '-', text)  # Replace spaces with -
-    text = re.sub(re.compile(r"[^\w\-]+"), '', text)  # Remove all non-word chars
-    text = re.sub(re.compile(r"--+"), '-', text)  # Replace multiple - with single -
-    text = re.sub(re.compile(r"^-+"), '', text)  # Trim - from start of text
-    text = re.sub(re.compile(r"-+$"), '', text)  # Trim - from end of text
+    text = _slugify(str(text))
     # Checks if the tag is actually a valid tag in Obsidian - still appends the hash even if not, but warns at least
     if taggify:
-        if re.match('[0-9]', text):
+        if text[:1].isascii() and text[:1].isdigit():
             logger.warning(ErrorMsg.print(ErrorMsg.INVALID_OBSIDIAN_TAGS, text))
     return '#' + text if taggify else text
 
 
+@functools.lru_cache(maxsize=1024)
+def _slugify(text: str) -> str:
+    """
+    The pure part of :func:`slugify`. Activities repeat on almost every row, so each distinct one is processed once.
+    Warnings are left to the caller, so they are still logged every time an invalid tag is used.
+    """
+    text = text.lower().strip()  # get rid of trailing spaces left after splitting activities apart from one string
+    text = _WHITESPACE_RE.sub('-', text)  # Replace spaces with -
+    text = _NON_WORD_RE.sub('', text)  # Remove all non-word chars
+    text = _REPEATED_DASH_RE.sub('-', text)  # Replace multiple - with single -
+    return text.strip('-')  # Trim - from start and end of text
+
+
 def expand_path(path: str) -> str:
     """
     Expand all %variables%, ~/home-directories and relative parts in the path. Return the expanded path.
@@ -144,7 +160,12 @@ def slice_quotes(string: str) -> Optional[str]:
     :returns: string without quotation marks in the beginning and end of the initial string, or nothing if "" provided.
     """
     # only 2 characters? Then it is an empty cell, because Daylio wraps its values inside "" like so: "","","",""...
-    return string.strip("\"").strip() if string and len(string) > 2 else None
+    if not string or len(string) <= 2:
+        return None
+    # A properly wrapped value only needs its first and last character sliced off, so do not scan for more quotes
+    if string[0] == string[-1] == "\"":
+        return string[1:-1].strip()
+    return string.strip("\"").strip()
 
 
 def strip_and_get_truthy(delimited_string: str, delimiter: str) -> List[str]:
@@ -208,6 +229,30 @@ class CsvLoader(FileLoader):
 DATE AND TIME
 ---------------------------------------------------------------------------------------------------------------------"""
 
+# Daylio always exports dates as YYYY-MM-DD, so this pattern is tried first before falling back on strptime() formats
+# [0-9] instead of \d, because \d would also match non-ASCII digits
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+
+# Daylio rows share dates and round times a lot, and datetime objects are immutable, so the results can be shared safely
+@functools.lru_cache(maxsize=4096)
+def _date_from_string(this: str) -> datetime.date:
+    this = this.strip()
+    # Fast path - skip the strptime() loop for the ISO 8601 format used by Daylio
+    match = _ISO_DATE_RE.fullmatch(this)
+    if match:
+        try:
+            return datetime.date(*(int(el) for el in match.groups()))
+        except ValueError as err:
+            raise InvalidDateError(this) from err
+    formats = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%B %d, %Y", "%d %B %Y", "%Y%m%d"]
+    for fmt in formats:
+        try:
+            return datetime.datetime.strptime(this, fmt).date()
+        except ValueError:
+            continue
+    raise InvalidDateError(this)
+
 
 def guess_date_type(this: typing.Union[datetime.date, str, typing.List[str], typing.List[int]]) -> datetime.date:
     """
@@ -236,15 +281,8 @@ def guess_date_type(this: typing.Union[datetime.date, str, typing.List[str], typ
     proper_date_obj: datetime.date
 
     if isinstance(this, str):
-        this = this.strip()
-        formats = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%B %d, %Y", "%d %B %Y", "%Y%m%d"]
-        for fmt in formats:
-            try:
-                return datetime.datetime.strptime(this, fmt).date()
-            except ValueError:
-                continue
-        raise InvalidDateError(this)
-    elif isinstance(this, typing.List) and len(this) == 3:
+        return _date_from_string(this)
+    if isinstance(this, typing.List) and len(this) == 3:
         year, month, day = (int(el) for el in this)
         try:
             proper_date_obj = datetime.date(year, month, day)
@@ -258,6 +296,47 @@ def guess_date_type(this: typing.Union[datetime.date, str, typing.List[str], typ
     return proper_date_obj
 
 
+def _parse_time_fast(this: str) -> Optional[datetime.time]:
+    """
+    Hand-written parser for the ``H:MM``, ``HH:MM`` and ``H:MM AM/PM`` variants that make up virtually all Daylio rows.
+    It is much cheaper than trying each :func:`datetime.datetime.strptime` format in turn.
+    :param this: already stripped string
+    :return: :class:`datetime.time` object or None if the string needs to be checked by the slower strptime() formats
+    """
+    hours, sep, rest = this.partition(":")
+    minutes, meridiem = rest[:2], rest[2:].strip().upper()
+    # isdigit() on its own would also accept non-ASCII digits such as "²", which int() cannot handle
+    if not sep or not 0 < len(hours) <= 2 or not (hours + minutes).isascii() or not (hours + minutes).isdigit() \
+            or len(minutes) != 2:
+        return None
+
+    hour, minute = int(hours), int(minutes)
+    if minute > 59:
+        return None
+    if not meridiem:
+        return datetime.time(hour, minute) if hour < 24 else None
+    if meridiem not in ("AM", "PM") or not 1 <= hour <= 12:
+        return None
+    # 12 AM is midnight and 12 PM is noon
+    return datetime.time(hour % 12 + (12 if meridiem == "PM" else 0), minute)
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_from_string(this: str) -> datetime.time:
+    # Fast path - anything the hand-written parser is not sure about still goes through strptime() below
+    proper_time_obj = _parse_time_fast(this.strip())
+    if proper_time_obj is not None:
+        return proper_time_obj
+    formats = ["%I:%M %p", "%I:%M%p", "%H:%M", "%-I:%M %p", "%-I:%M%p", "%-H:%M"]
+    for fmt in formats:
+        try:
+            # https://stackoverflow.com/questions/3183707/stripping-off-the-seconds-in-datetime-python
+            return datetime.datetime.strptime(this.strip(), fmt).time().replace(second=0, microsecond=0)
+        except ValueError:
+            continue
+    raise InvalidTimeError(this)
+
+
 def guess_time_type(this: typing.Union[datetime.time, str, typing.List[str], typing.List[int]]) -> datetime.time:
     """
     Supported formats
@@ -284,17 +363,8 @@ def guess_time_type(this: typing.Union[datetime.time, str, typing.List[str], typ
     proper_time_obj: datetime.time
 
     if isinstance(this, str):
-        formats = ["%I:%M %p", "%I:%M%p", "%H:%M", "%-I:%M %p", "%-I:%M%p", "%-H:%M"]
-        for fmt in formats:
-            try:
-                # https://stackoverflow.com/questions/3183707/stripping-off-the-seconds-in-datetime-python
-                proper_time_obj = datetime.datetime.strptime(this.strip(), fmt).time()
-                break
-            except ValueError:
-                continue
-        else:
-            raise InvalidTimeError(this)
-    elif isinstance(this, typing.List) and len(this) == 2:
+        return _time_from_string(this)
+    if isinstance(this, typing.List) and len(this) == 2:
         hours, minutes = (int(el) for el in this)
         try:
             proper_time_obj = datetime.time(hours, minutes)
@@ -0,0 +1,33 @@
+import datetime
+import itertools
+import typing
+from unittest import TestCase
+
+
+def expected_path(date: str) -> str:
+    """Returns where the note that ``tests/files/all-valid.csv`` should produce with default settings is kept."""
+    return f"tests/files/scenarios/ok/expect/{date}.md"
+
+
+def written_path(output_dir: str, date: str) -> str:
+    """Returns where the parser writes the note for a date (e.g. ``2022-10-25``) inside ``output_dir``."""
+    # same layout as Librarian.output_all - the month folder is not zero-padded, so "2021/1/2021-01-01.md"
+    day = datetime.date.fromisoformat(date)
+    return "/".join([output_dir, str(day.year), str(day.month), f"{date}.md"])
+
+
+def assert_note_as_expected(test_case: TestCase, output_dir: str, date: str,
+                            adjust: typing.Callable[[str], str] = lambda line: line):
+    """
+    Compares the note written for ``date`` with the expected one, line by line.
+    Both files are streamed and the comparison stops at the first line that differs.
+    :param adjust: applied to every expected line first, for output made with other than default settings
+    """
+    with open(expected_path(date), encoding="UTF-8") as expected, \
+            open(written_path(output_dir, date), encoding="UTF-8") as written:
+        for line_number, (expected_line, written_line) in enumerate(
+                itertools.zip_longest(map(adjust, expected), written), start=1):
+            if expected_line != written_line:
+                test_case.fail(f"{date}.md differs at line {line_number}:\n"
+                               f"- {expected_line!r}\n"
+                               f"+ {written_line!r}")
@@ -1,4 +1,5 @@
 import datetime
+import types
 from unittest import TestCase
 
 import tests.suppress as suppress
@@ -8,44 +9,70 @@ from daylio_to_md.group import \
     IncompleteDataRow
 from daylio_to_md.utils import InvalidDateError, InvalidTimeError
 
+# Read-only CSV rows shared by all tests, so they are not rebuilt every time setUp() runs
+ROW_10_AM = types.MappingProxyType({
+    "time": "10:00 AM",
+    "mood": "vaguely ok",
+    "activities": "",
+    "note_title": "",
+    "note": ""
+})
+ROW_9_30_PM = types.MappingProxyType({
+    "time": "9:30 PM",
+    "mood": "awful",
+    "activities": "",
+    "note_title": "",
+    "note": ""
+})
+
+VALID_DATES = (
+    ("2023-10-15", datetime.date(2023, 10, 15)),
+    ("2019-5-9", datetime.date(2019, 5, 9)),
+    ("2023-11-25", datetime.date(2023, 11, 25)),
+    ("   2022-05-18  ", datetime.date(2022, 5, 18))  # Spaces around the date
+)
+INVALID_DATES = (
+    "00-",
+    "2199-32-32",
+    # Test cases with unconventional date formats
+    "2022/05/18",  # Invalid separator
+    "2023_07_12",  # Invalid separator
+    "1999.10.25",  # Invalid separator
+    # Test cases with random characters in the date string
+    "2@#0$2-05-18",  # Special characters in the year
+    "1987-0%4-12",  # Special characters in the month
+    "2001-07-3*",  # Special characters in the day
+    # Test cases with excessive spaces
+    "1999- 10-25",  # Spaces within the date
+    "  2000-04 -  12  ",  # Spaces within the date
+    # Test cases with mixed characters and numbers
+    "2k20-05-18",  # Non-numeric characters in the year
+    "1999-0ne-25",  # Non-numeric characters in the month
+    "2021-07-Two",  # Non-numeric characters in the day
+    # Test cases with missing parts of the date
+    "2022-05",  # Missing day
+    "1987-09",  # Missing day
+    "2001",  # Missing month and day
+    ""  # Empty string
+)
+
 
 class TestDate(TestCase):
+    @classmethod
     @suppress.out
-    def setUp(self):
+    def setUpClass(cls):
+        # Tests only read from the sample date, so it is built once for the whole class.
+        # There is nothing to copy per test either - EntriesFrom hands out one shared instance per date anyway.
         # Create a sample date
-        self.sample_date = EntriesFrom("2011-10-10")
+        cls.sample_date = EntriesFrom("2011-10-10")
         # Append two sample entries to that day
-        self.sample_date.create_entry(
-            {
-                "time": "10:00 AM",
-                "mood": "vaguely ok",
-                "activities": "",
-                "note_title": "",
-                "note": ""
-            }
-        )
-        self.sample_date.create_entry(
-            {
-                "time": "9:30 PM",
-                "mood": "awful",
-                "activities": "",
-                "note_title": "",
-                "note": ""
-            }
-        )
+        cls.sample_date.create_entry(ROW_10_AM)
+        cls.sample_date.create_entry(ROW_9_30_PM)
 
     @suppress.out
     def test_creating_duplicates_which_are_allowed_in_daylio(self):
         # TODO: actually test this
-        self.sample_date.create_entry(
-            {
-                "time": "10:00 AM",
-                "mood": "vaguely ok",
-                "activities": "",
-                "note_title": "",
-                "note": ""
-            }
-        )
+        self.sample_date.create_entry(ROW_10_AM)
 
     @suppress.out
     def test_creating_entries_from_row(self):
@@ -53,15 +80,7 @@ class TestDate(TestCase):
         Test whether you can successfully create :class:`Entry` objects from this builder class.
         """
         my_date = EntriesFrom("1999-05-07")
-        my_date.create_entry(
-            {
-                "time": "10:00 AM",
-                "mood": "vaguely ok",
-                "activities": "",
-                "note_title": "",
-                "note": ""
-            }
-        )
+        my_date.create_entry(ROW_10_AM)
         # This lacks the minimum required keys - time and mood - to function correctly
         with self.assertRaises(IncompleteDataRow):
             my_date.create_entry(
@@ -73,51 +92,34 @@ class TestDate(TestCase):
                     "note": ""
                 }
             )
+        # Not having the key at all is just as bad as leaving it empty
+        with self.assertRaises(IncompleteDataRow):
+            my_date.create_entry(
+                {
+                    "time": "5:00 PM",
+                    "activities": "",
+                    "note_title": "",
+                    "note": ""
+                }
+            )
 
     @suppress.out
     def test_create_entry_groups(self):
         """
         Try to instantiate an object of :class:`DatedEntriesGroup` with either valid or invalid dates
         """
-        # str() function converts the object's uid, which in this case is a datetime.date object.
-        self.assertEqual("2023-10-15", str(EntriesFrom("2023-10-15")))
-        self.assertEqual("2019-05-09", str(EntriesFrom("2019-5-9")))
-        self.assertEqual("2023-11-25", str(EntriesFrom("2023-11-25")))
-        # direct comparison with a datetime.date object should on comparing only their dates
-        self.assertEqual(
-            datetime.date(2023, 10, 15),
-            EntriesFrom("2023-10-15").date)
-        self.assertEqual(
-            datetime.date(2022, 5, 18),
-            EntriesFrom("   2022-05-18  ").date)  # Spaces around the date
-
-        self.assertRaises(InvalidDateError, EntriesFrom, "00-")
-        self.assertRaises(InvalidDateError, EntriesFrom, "2199-32-32")
-
-        # Test cases with unconventional date formats
-        self.assertRaises(InvalidDateError, EntriesFrom, "2022/05/18")  # Invalid separator
-        self.assertRaises(InvalidDateError, EntriesFrom, "2023_07_12")  # Invalid separator
-        self.assertRaises(InvalidDateError, EntriesFrom, "1999.10.25")  # Invalid separator
-
-        # Test cases with random characters in the date string
-        self.assertRaises(InvalidDateError, EntriesFrom, "2@#0$2-05-18")  # Special characters in the year
-        self.assertRaises(InvalidDateError, EntriesFrom, "1987-0%4-12")  # Special characters in the month
-        self.assertRaises(InvalidDateError, EntriesFrom, "2001-07-3*")  # Special characters in the day
-
-        # Test cases with excessive spaces
-        self.assertRaises(InvalidDateError, EntriesFrom, "1999- 10-25")  # Spaces within the date
-        self.assertRaises(InvalidDateError, EntriesFrom, "  2000-04 -  12  ")  # Spaces within the date
-
-        # Test cases with mixed characters and numbers
-        self.assertRaises(InvalidDateError, EntriesFrom, "2k20-05-18")  # Non-numeric characters in the year
-        self.assertRaises(InvalidDateError, EntriesFrom, "1999-0ne-25")  # Non-numeric characters in the month
-        self.assertRaises(InvalidDateError, EntriesFrom, "2021-07-Two")  # Non-numeric characters in the day
-
-        # Test cases with missing parts of the date
-        self.assertRaises(InvalidDateError, EntriesFrom, "2022-05")  # Missing day
-        self.assertRaises(InvalidDateError, EntriesFrom, "1987-09")  # Missing day
-        self.assertRaises(InvalidDateError, EntriesFrom, "2001")  # Missing month and day
-        self.assertRaises(InvalidDateError, EntriesFrom, "")  # Empty string
+        for valid_date, expected_date in VALID_DATES:
+            with self.subTest(date=valid_date):
+                # Build each group once and check both of its faces
+                entries_from = EntriesFrom(valid_date)
+                # str() function converts the object's uid, which in this case is a datetime.date object.
+                self.assertEqual(expected_date.isoformat(), str(entries_from))
+                # direct comparison with a datetime.date object should on comparing only their dates
+                self.assertEqual(expected_date, entries_from.date)
+
+        for invalid_date in INVALID_DATES:
+            with self.subTest(date=invalid_date):
+                self.assertRaises(InvalidDateError, EntriesFrom, invalid_date)
 
     # noinspection PyStatementEffect,SpellCheckingInspection
     @suppress.out
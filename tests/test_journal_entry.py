@@ -23,7 +23,7 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(1, 49), bare_minimum_entry.time)
         self.assertIsNone(bare_minimum_entry.title)
         self.assertIsNone(bare_minimum_entry.note)
-        self.assertListEqual([], bare_minimum_entry.activities)
+        self.assertTupleEqual((), bare_minimum_entry.activities)
 
     def test_bare_minimum_journal_entries_from_builder_class(self):
         # When
@@ -37,7 +37,7 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(1, 49), bare_minimum_entry.time)
         self.assertIsNone(bare_minimum_entry.title)
         self.assertIsNone(bare_minimum_entry.note)
-        self.assertListEqual([], bare_minimum_entry.activities)
+        self.assertTupleEqual((), bare_minimum_entry.activities)
 
     @suppress.out
     def test_other_variants_of_journal_entries(self):
@@ -53,7 +53,7 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(1, 49), entry.time)
         self.assertEqual("Normal situation", entry.title)
         self.assertIsNone(entry.note)
-        self.assertListEqual([], entry.activities)
+        self.assertTupleEqual((), entry.activities)
 
         # When
         entry = EntryBuilder().build(
@@ -68,7 +68,7 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(1, 49), entry.time)
         self.assertEqual("Normal situation", entry.title)
         self.assertEqual("A completely normal situation just occurred.", entry.note)
-        self.assertListEqual([], entry.activities)
+        self.assertTupleEqual((), entry.activities)
 
         # When
         entry = EntryBuilder(tag_activities=True).build(
@@ -84,7 +84,7 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(1, 49), entry.time)
         self.assertEqual("Normal situation", entry.title)
         self.assertEqual("A completely normal situation just occurred.", entry.note)
-        self.assertListEqual(["#bicycle", "#chess", "#gaming"], entry.activities)
+        self.assertTupleEqual(("#bicycle", "#chess", "#gaming"), entry.activities)
 
         # When
         entry = EntryBuilder(tag_activities=False).build(
@@ -100,7 +100,7 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(15, 49), entry.time)
         self.assertEqual("Normal situation", entry.title)
         self.assertEqual("A completely normal situation just occurred.", entry.note)
-        self.assertListEqual(["bicycle", "chess", "gaming"], entry.activities)
+        self.assertTupleEqual(("bicycle", "chess", "gaming"), entry.activities)
 
     @suppress.out
     def test_insufficient_journal_entries(self):
@@ -121,4 +121,14 @@ class TestJournalEntry(TestCase):
         self.assertEqual(datetime.time(23, 49), entry.time)
         self.assertIsNone(entry.title)
         self.assertIsNone(entry.note)
-        self.assertListEqual(['#bicycle', '#qqchess', '#gaming-q4'], entry.activities)
+        self.assertTupleEqual(('#bicycle', '#qqchess', '#gaming-q4'), entry.activities)
+
+    @suppress.out
+    def test_repeated_moods_and_activities_share_strings(self):
+        # Build equal strings at runtime, so they are not already the same constant object
+        first = Entry(time="10:00", mood="".join(["vaguely", " ok"]), activities="".join(["chess", "|bicycle"]))
+        second = Entry(time="11:00", mood="vaguely ok", activities="chess|bicycle")
+
+        self.assertIs(first.mood, second.mood)
+        for first_activity, second_activity in zip(first.activities, second.activities):
+            self.assertIs(first_activity, second_activity)
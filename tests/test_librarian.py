@@ -14,6 +14,19 @@ class TestLibrarian(TestCase):
     We use internal class methods to check proper handling of data throughout the process.
     """
 
+    @classmethod
+    @suppress.out
+    def setUpClass(cls):
+        # Tests that only read from the journal share one parsed instance instead of parsing the same CSV every time
+        cls.valid_lib = Librarian(
+            path_to_file="tests/files/all-valid.csv",
+            path_to_moods="all-valid.json"
+        )
+        cls.invalid_moods_lib = Librarian(
+            path_to_file="tests/files/all-valid.csv",
+            path_to_moods="tests/files/scenarios/fail/empty.csv"
+        )
+
     @suppress.out
     def test_init_valid_csv(self):
         self.assertTrue(Librarian("tests/files/all-valid.csv"))
@@ -46,11 +59,7 @@ class TestLibrarian(TestCase):
         All the following dates exist in the ``tests/files/all-valid.csv``.
         They should be accessible by ``lib``.
         """
-        # When
-        lib = Librarian(
-            path_to_file="tests/files/all-valid.csv",
-            path_to_moods="all-valid.json"
-        )
+        lib = self.valid_lib
 
         # Then
         self.assertTrue(lib["2022-10-25"])
@@ -64,11 +73,7 @@ class TestLibrarian(TestCase):
         **None** of the following dates exist in the ``tests/files/all-valid.csv``.
         Therefore, they should **NOT** be accessible by ``lib``.
         """
-        # When
-        lib = Librarian(
-            path_to_file="tests/files/all-valid.csv",
-            path_to_moods="all-valid.json"
-        )
+        lib = self.valid_lib
 
         self.assertRaises(KeyError, lambda: lib["2022-10-21"])
         self.assertRaises(KeyError, lambda: lib["2022-10-20"])
@@ -99,18 +104,12 @@ class TestLibrarian(TestCase):
     @suppress.out
     def test_custom_moods_with_invalid_jsons(self):
         """Pass faulty moods and see if it has no custom moods loaded."""
-        lib = Librarian(
-            path_to_file="tests/files/all-valid.csv",
-            path_to_moods="tests/files/scenarios/fail/empty.csv"
-        )
+        lib = self.invalid_moods_lib
         self.assertEqual(0, len(lib.mood_set.get_custom_moods))
 
     @suppress.out
     def test_custom_moods_when_json_invalid(self):
-        lib = Librarian(
-            path_to_file="tests/files/all-valid.csv",
-            path_to_moods="tests/files/scenarios/fail/empty.csv"
-        )
+        lib = self.invalid_moods_lib
         default = Moodverse()
         self.assertDictEqual(lib.mood_set.get_moods, default.get_moods,
                              msg="\n".join([
@@ -118,6 +117,7 @@ class TestLibrarian(TestCase):
                                  "default object ID:\t" + str(id(default))
                              ])
                              )
+        # A second, freshly built instance must not see the first one's mood set either
         lib = Librarian(
             path_to_file="tests/files/all-valid.csv",
             path_to_moods="tests/files/scenarios/fail/empty.csv"
@@ -0,0 +1,35 @@
+import tempfile
+from unittest import TestCase
+
+from tests import daily_notes, suppress
+from daylio_to_md.__main__ import main
+from daylio_to_md.group import EntriesFrom
+
+
+class TestMain(TestCase):
+    """
+    Runs the whole program in-process, with the same arguments a user would type into the console.
+    Output with default settings is already checked by :class:`tests.test_output.TestOutputFileStructure`,
+    so this checks if the console options actually reach the files.
+    """
+
+    def setUp(self):
+        # EntriesFrom remembers instances per date, which would carry over settings from other tests
+        EntriesFrom._instances = {}
+
+    @suppress.out
+    def test_main_with_console_options(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            # --front_matter_tags takes any number of values, so it has to be the last option
+            main(["tests/files/all-valid.csv", output_dir, "--header", "3", "--front_matter_tags", "foo", "bar"])
+
+            for date in ["2022-10-25", "2022-10-26", "2022-10-27", "2022-10-30"]:
+                with self.subTest(date=date):
+                    daily_notes.assert_note_as_expected(self, output_dir, date, adjust=with_console_options)
+
+
+def with_console_options(line: str) -> str:
+    """Same journal as the default expected files, just with different tags and deeper headers."""
+    if line.startswith("## "):
+        return "#" + line
+    return line.replace("tags: daylio", "tags: bar,foo")
@@ -16,6 +16,9 @@ class TestMoodverse(TestCase):
             Moodverse()["amazing"]
         # don't compare Moodverses by their memory address, but by their contents
         self.assertEqual(Moodverse(), Moodverse())
+        # comparing with other types is left to Python instead of returning None
+        # == turns NotImplemented into False, so __eq__ has to be called directly to see it
+        self.assertIs(Moodverse().__eq__({}), NotImplemented)  # pylint: disable=unnecessary-dunder-call
 
     @suppress.out
     def test_loading_valid_moods_into_moodverse(self):
@@ -109,6 +112,17 @@ class TestMoodverse(TestCase):
         }
         self.assertEqual(1, len(Moodverse(bad_moods_loaded_from_json).get_custom_moods))
 
+    @suppress.out
+    def test_loading_duplicated_moods(self):
+        moodlist_with_duplicates = {
+            "rad": ["amazing", "amazing"],
+            "good": ["nice", "amazing"]  # already known from the "rad" group, so the first group wins
+        }
+        self.assertDictEqual(
+            {"amazing": "rad", "nice": "good"},
+            Moodverse(moodlist_with_duplicates).get_custom_moods
+        )
+
     @suppress.out
     def test_loading_same_moods_as_already_existing(self):
         self.assertDictEqual(
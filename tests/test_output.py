@@ -1,172 +1,80 @@
 import io
-import os
-import shutil
+import tempfile
 from unittest import TestCase
 
 import tests.suppress as suppress
+from tests import daily_notes
 from daylio_to_md.group import EntriesFrom, EntriesFromBuilder
 from daylio_to_md.journal_entry import Entry, EntryBuilder
 from daylio_to_md.librarian import Librarian
 
 
+# Front matter block that opens every day file with valid tags, followed by an empty line
+FRONT_MATTER = "---\ntags: {}\n---\n\n"
+
+# Each case: what the entry holds, arguments to build it with, and the exact text it should output
+ENTRY_OUTPUTS = [
+    ("time, mood & activities",
+     {"time": "11:00", "mood": "great", "activities": "bicycle | chess"},
+     "## great | 11:00\n#bicycle #chess"),
+    ("time, mood, activities & title",
+     {"time": "11:00", "mood": "great", "activities": "bicycle | chess", "title": "I'm super pumped!"},
+     "## great | 11:00 | I'm super pumped!\n#bicycle #chess"),
+    ("time, mood, activities, title & note",
+     {"time": "11:00", "mood": "great", "activities": "bicycle | chess", "title": "I'm super pumped!",
+      "note": "I believe I can fly, I believe I can touch the sky."},
+     "## great | 11:00 | I'm super pumped!\n#bicycle #chess\nI believe I can fly, I believe I can touch the sky."),
+    ("activities without hashtags",
+     {"time": "11:00", "mood": "great", "activities": "bicycle | chess", "tag_activities": False},
+     "## great | 11:00\nbicycle chess"),
+    ("header multiplier",
+     {"time": "11:00", "mood": "great", "title": "Feeling pumped@!", "header_multiplier": 5},
+     "##### great | 11:00 | Feeling pumped@!"),
+]
+
+
 class TestEntriesFromOutput(TestCase):
     """
     Since the sample entry can output to any stream from :class:`io.IOBase`, you can treat the StringIO as fake file
-    If the contents outputted to this fake file are the same as contents written directly to another fake stream,
-    then everything looks good.
+    If the contents outputted to this fake file are the same as the expected text, then everything looks good.
 
     Obviously any change to formatting in the class definition will force changes in this test case.
     """
 
     @suppress.out
-    def test_bare_minimum_entry_content(self):
-        """
-        Output an entry which hold information only on:
-
-        * time
-        * mood
-        """
-        # WHEN
-        # ---
-        # Create our fake entry as well as a stream that acts like a file
-        my_entry = Entry(time="11:00", mood="great", activities="bicycle | chess")
-
-        with io.StringIO() as my_fake_file_stream:
-            my_entry.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("## great | 11:00" + "\n")
-                compare_stream.write("#bicycle #chess")
-
-                # THEN
+    def test_entry_outputs(self):
+        for description, entry_kwargs, expected_output in ENTRY_OUTPUTS:
+            with self.subTest(description):
+                # WHEN
                 # ---
-                # getvalue() returns the entire stream content regardless of current stream position, read() does not.
-                # https://stackoverflow.com/a/53485819
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+                # Create our fake entry as well as a stream that acts like a file
+                my_entry = Entry(**entry_kwargs)
 
-    @suppress.out
-    def test_entry_with_title_no_note(self):
-        """
-        Output an entry which hold information on:
-
-        * time
-        * mood
-        * title
-        """
-        # WHEN
-        # ---
-        # Create our fake entry as well as a stream that acts like a file
-        my_entry = Entry(time="11:00", mood="great", activities="bicycle | chess", title="I'm super pumped!")
+                with io.StringIO() as my_fake_file_stream:
+                    my_entry.output(my_fake_file_stream)
 
-        with io.StringIO() as my_fake_file_stream:
-            my_entry.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("## great | 11:00 | I'm super pumped!" + "\n")
-                compare_stream.write("#bicycle #chess")
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+                    # THEN
+                    # ---
+                    # getvalue() returns the entire stream content regardless of current stream position,
+                    # read() does not. https://stackoverflow.com/a/53485819
+                    self.assertEqual(expected_output, my_fake_file_stream.getvalue())
 
     @suppress.out
-    def test_entry_with_title_and_note(self):
+    def test_render_and_output_length(self):
         """
-        Output an entry which hold information on:
-
-        * time
-        * mood
-        * title
-        * activities
-        * note
+        :meth:`Entry.render` returns the entry as text without a stream, :meth:`Entry.output` returns its length.
         """
-        # WHEN
-        # ---
-        # Create our fake entry as well as a stream that acts like a file
         my_entry = Entry(time="11:00", mood="great", activities="bicycle | chess", title="I'm super pumped!",
                          note="I believe I can fly, I believe I can touch the sky.")
+        expected_output = (
+            "## great | 11:00 | I'm super pumped!\n"
+            "#bicycle #chess\n"
+            "I believe I can fly, I believe I can touch the sky."
+        )
 
+        self.assertEqual(expected_output, my_entry.render())
         with io.StringIO() as my_fake_file_stream:
-            my_entry.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("## great | 11:00 | I'm super pumped!" + "\n")
-                compare_stream.write("#bicycle #chess" + "\n")
-                compare_stream.write("I believe I can fly, I believe I can touch the sky.")
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
-
-    @suppress.out
-    def test_entry_with_hashtagged_activities(self):
-        """
-        Output an entry which hold information on:
-
-        * time
-        * mood
-        * activities (with and without hashtags)
-        """
-        # WHEN
-        # ---
-        # Create our fake entry as well as a stream that acts like a file
-        my_entry = Entry(time="11:00", mood="great", activities="bicycle | chess")
-
-        with io.StringIO() as my_fake_file_stream:
-            my_entry.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("## great | 11:00" + "\n")
-                compare_stream.write("#bicycle #chess")
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
-
-        # WHEN
-        # ---
-        # Create our fake entry as well as a stream that acts like a file
-        my_entry = Entry(time="11:00", mood="great", activities="bicycle | chess", tag_activities=False)
-
-        with io.StringIO() as my_fake_file_stream:
-            my_entry.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("## great | 11:00" + "\n")
-                compare_stream.write("bicycle chess")
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
-
-    @suppress.out
-    def test_header_multiplier(self):
-        # WHEN
-        # ---
-        # Create our fake entry as well as a stream that acts like a file
-        my_entry = Entry(time="11:00", mood="great", title="Feeling pumped@!", header_multiplier=5)
-
-        with io.StringIO() as my_fake_file_stream:
-            my_entry.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("##### great | 11:00 | Feeling pumped@!")
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+            self.assertEqual(len(expected_output), my_entry.output(my_fake_file_stream))
 
 
 class TestDatedEntriesGroup(TestCase):
@@ -192,19 +100,14 @@ class TestDatedEntriesGroup(TestCase):
 
         with io.StringIO() as my_fake_file_stream:
             sample_date.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("---" + "\n")
-                compare_stream.write("tags: daylio" + "\n")
-                compare_stream.write("---" + "\n" * 2)
 
-                compare_stream.write("## vaguely ok | 10:00" + "\n" * 2)
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+            # THEN
+            # ---
+            expected_output = (
+                FRONT_MATTER.format("daylio") +
+                "## vaguely ok | 10:00\n\n"
+            )
+            self.assertEqual(expected_output, my_fake_file_stream.getvalue())
 
     @suppress.out
     def test_outputting_day_with_two_entries(self):
@@ -230,23 +133,17 @@ class TestDatedEntriesGroup(TestCase):
 
         with io.StringIO() as my_fake_file_stream:
             sample_date.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("---" + "\n")
-                compare_stream.write("tags: daylio" + "\n")
-                compare_stream.write("---" + "\n" * 2)
-
-                compare_stream.write("## vaguely ok | 10:00" + "\n")
-                compare_stream.write("#bowling" + "\n")
-                compare_stream.write("Feeling kinda ok." + "\n" * 2)
 
-                compare_stream.write("## awful | 21:30 | Everything is going downhill for me" + "\n" * 2)
-
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+            # THEN
+            # ---
+            expected_output = (
+                FRONT_MATTER.format("daylio") +
+                "## vaguely ok | 10:00\n"
+                "#bowling\n"
+                "Feeling kinda ok.\n\n"
+                "## awful | 21:30 | Everything is going downhill for me\n\n"
+            )
+            self.assertEqual(expected_output, my_fake_file_stream.getvalue())
 
     @suppress.out
     def test_outputting_day_with_two_entries_and_invalid_filetags(self):
@@ -274,19 +171,16 @@ class TestDatedEntriesGroup(TestCase):
 
         with io.StringIO() as my_fake_file_stream:
             sample_date.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("## vaguely ok | 10:00" + "\n")
-                compare_stream.write("#bowling" + "\n")
-                compare_stream.write("Feeling kinda meh." + "\n" * 2)
-
-                compare_stream.write("## awful | 21:30 | Everything is going downhill for me" + "\n" * 2)
 
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+            # THEN
+            # ---
+            expected_output = (
+                "## vaguely ok | 10:00\n"
+                "#bowling\n"
+                "Feeling kinda meh.\n\n"
+                "## awful | 21:30 | Everything is going downhill for me\n\n"
+            )
+            self.assertEqual(expected_output, my_fake_file_stream.getvalue())
 
     @suppress.out
     def test_outputting_day_with_two_entries_and_partially_valid_filetags(self):
@@ -314,23 +208,35 @@ class TestDatedEntriesGroup(TestCase):
 
         with io.StringIO() as my_fake_file_stream:
             sample_date.output(my_fake_file_stream)
-            # AND
-            # ---
-            # Then create another stream and fill it with the same content, but written directly, not through object
-            with io.StringIO() as compare_stream:
-                compare_stream.write("---" + "\n")
-                compare_stream.write("tags: bar,foo" + "\n")
-                compare_stream.write("---" + "\n" * 2)
 
-                compare_stream.write("## vaguely ok | 10:00" + "\n")
-                compare_stream.write("#bowling" + "\n")
-                compare_stream.write("Feeling fine, I guess." + "\n" * 2)
+            # THEN
+            # ---
+            expected_output = (
+                FRONT_MATTER.format("bar,foo") +
+                "## vaguely ok | 10:00\n"
+                "#bowling\n"
+                "Feeling fine, I guess.\n\n"
+                "## awful | 21:30 | Everything is going downhill for me\n\n"
+            )
+            self.assertEqual(expected_output, my_fake_file_stream.getvalue())
 
-                compare_stream.write("## awful | 21:30 | Everything is going downhill for me" + "\n" * 2)
+    @suppress.out
+    def test_render_and_output_length(self):
+        """
+        :meth:`EntriesFrom.render` returns the whole day as text without a stream,
+        :meth:`EntriesFrom.output` returns its length.
+        """
+        sample_date = EntriesFrom("2011-10-10", front_matter_tags=["foo"])
+        sample_date.add(Entry(time="10:00 AM", mood="vaguely ok", activities="bowling"))
+        expected_output = (
+            FRONT_MATTER.format("foo") +
+            "## vaguely ok | 10:00\n"
+            "#bowling\n\n"
+        )
 
-                # THEN
-                # ---
-                self.assertEqual(compare_stream.getvalue(), my_fake_file_stream.getvalue())
+        self.assertEqual(expected_output, sample_date.render())
+        with io.StringIO() as my_fake_file_stream:
+            self.assertEqual(len(expected_output), sample_date.output(my_fake_file_stream))
 
 
 class TestOutputFileStructure(TestCase):
@@ -339,39 +245,33 @@ class TestOutputFileStructure(TestCase):
     This checks if the :class:`Librarian` class creates the necessary directories and outputs to files.
     """
 
+    @classmethod
     @suppress.out
-    def test_directory_loop(self):
+    def setUpClass(cls):
         """
         Loops through known dates and asks each :class:`EntriesFrom` to output its contents to a specified file.
+        The journal is parsed and written out only once, each test then checks a different file from that output.
         """
+        # EntriesFrom remembers instances per date, which would carry over entries from other tests
+        EntriesFrom._instances = {}
+        cls.output_dir = tempfile.TemporaryDirectory()
+        Librarian("tests/files/all-valid.csv", path_to_output=cls.output_dir.name).output_all()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.output_dir.cleanup()
+
+    def assert_day_output_as_expected(self, date: str):
+        daily_notes.assert_note_as_expected(self, self.output_dir.name, date)
+
+    def test_2022_10_25(self):
+        self.assert_day_output_as_expected("2022-10-25")
+
+    def test_2022_10_26(self):
+        self.assert_day_output_as_expected("2022-10-26")
+
+    def test_2022_10_27(self):
+        self.assert_day_output_as_expected("2022-10-27")
 
-        lib = Librarian("tests/files/all-valid.csv", path_to_output="tests/files/scenarios/ok/out")
-        lib.output_all()
-
-        with open("tests/files/scenarios/ok/out/2022/10/2022-10-25.md", encoding="UTF-8") as parsed_result, \
-                open("tests/files/scenarios/ok/expect/2022-10-25.md", encoding="UTF-8") as expected_result:
-            self.assertListEqual(expected_result.readlines(), parsed_result.readlines())
-
-        with open("tests/files/scenarios/ok/out/2022/10/2022-10-26.md", encoding="UTF-8") as parsed_result, \
-                open("tests/files/scenarios/ok/expect/2022-10-26.md", encoding="UTF-8") as expected_result:
-            self.assertListEqual(expected_result.readlines(), parsed_result.readlines())
-
-        with open("tests/files/scenarios/ok/out/2022/10/2022-10-27.md", encoding="UTF-8") as parsed_result, \
-                open("tests/files/scenarios/ok/expect/2022-10-27.md", encoding="UTF-8") as expected_result:
-            self.assertListEqual(expected_result.readlines(), parsed_result.readlines())
-
-        with open("tests/files/scenarios/ok/out/2022/10/2022-10-30.md", encoding="UTF-8") as parsed_result, \
-                open("tests/files/scenarios/ok/expect/2022-10-30.md", encoding="UTF-8") as expected_result:
-            self.assertListEqual(expected_result.readlines(), parsed_result.readlines())
-
-    def tearDown(self) -> None:
-        folder = 'tests/files/scenarios/ok/out'
-        for filename in os.listdir(folder):
-            file_path = os.path.join(folder, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except OSError as e:
-                print(f"Failed to delete {file_path} while cleaning up after a test. Reason: {e}")
+    def test_2022_10_30(self):
+        self.assert_day_output_as_expected("2022-10-30")
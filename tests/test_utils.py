@@ -20,6 +20,9 @@ class TestSlugify(TestCase):
         self.assertEqual("хлеба-нашего-повшеднего", utils.slugify("Хлеба нашего повшеднего", False))
 
         # check if the slug is a valid tag
+        with self.assertLogs(logging.getLogger("daylio_to_md.utils"), logging.WARNING):
+            utils.slugify("1. Digit cannot appear at the beginning of a tag", True)
+        # slugs are cached, but the warning should still be logged every time an invalid tag is used
         with self.assertLogs(logging.getLogger("daylio_to_md.utils"), logging.WARNING):
             utils.slugify("1. Digit cannot appear at the beginning of a tag", True)
 
@@ -58,6 +61,8 @@ class TestSlicing(TestCase):
         self.assertEqual("test", utils.slice_quotes("\"test\""))
         self.assertIsNone(utils.slice_quotes("\"\""))
         self.assertEqual("bicycle", utils.slice_quotes("\" bicycle   \""))
+        # only the wrapping quotes are removed, quotes inside the value stay intact
+        self.assertEqual("He said \"hi\"", utils.slice_quotes("\"He said \"hi\"\""))
 
 
 class TestIOContextManager(TestCase):
@@ -84,56 +89,54 @@ class TestIOContextManager(TestCase):
             self.assertDictEqual(expected_dict, next(example_file))
 
 
-class TestDateTimeGuessing(TestCase):
-    def test_12_hour_format(self):
-        self.assertEqual(guess_time_type("02:30 PM"), datetime.time(14, 30))
-        self.assertEqual(guess_time_type("12:00 AM"), datetime.time(0, 0))
-        self.assertEqual(guess_time_type("12:00 PM"), datetime.time(12, 0))
-
-    def test_24_hour_format(self):
-        self.assertEqual(guess_time_type("14:30"), datetime.time(14, 30))
-        self.assertEqual(guess_time_type("00:00"), datetime.time(0, 0))
-        self.assertEqual(guess_time_type("23:59"), datetime.time(23, 59))
-
-    def test_no_leading_zero(self):
-        self.assertEqual(guess_time_type("2:30 PM"), datetime.time(14, 30))
-        self.assertEqual(guess_time_type("2:30"), datetime.time(2, 30))
-
-    def test_list_input(self):
-        self.assertEqual(guess_time_type([14, 30]), datetime.time(14, 30))
-        self.assertEqual(guess_time_type([0, 0]), datetime.time(0, 0))
-        self.assertEqual(guess_time_type([23, 59]), datetime.time(23, 59))
+VALID_TIMES = (
+    # 12-hour format
+    ("02:30 PM", datetime.time(14, 30)),
+    ("12:00 AM", datetime.time(0, 0)),
+    ("12:00 PM", datetime.time(12, 0)),
+    # 24-hour format
+    ("14:30", datetime.time(14, 30)),
+    ("00:00", datetime.time(0, 0)),
+    ("23:59", datetime.time(23, 59)),
+    # no leading zero
+    ("2:30 PM", datetime.time(14, 30)),
+    ("2:30", datetime.time(2, 30)),
+    # list input
+    ([14, 30], datetime.time(14, 30)),
+    ([0, 0], datetime.time(0, 0)),
+    ([23, 59], datetime.time(23, 59)),
+    # time object input
+    (datetime.time(14, 30), datetime.time(14, 30)),
+    (datetime.time(0, 0), datetime.time(0, 0)),
+    # edge cases
+    ("11:59 PM", datetime.time(23, 59)),
+    ("12:01 AM", datetime.time(0, 1)),
+    ("12:59 PM", datetime.time(12, 59)),
+    # string variations
+    ("2:30PM", datetime.time(14, 30)),
+    ("2:30 pm", datetime.time(14, 30)),
+    ("02:30pm", datetime.time(14, 30)),
+    # whitespace handling
+    ("  14:30  ", datetime.time(14, 30)),
+    ("2:30 PM  ", datetime.time(14, 30))
+)
+INVALID_TIMES = ("25:00", "14:60", "2:30 ZM", [14, 30, 0], [14], "not a time")
 
-    def test_time_object_input(self):
-        self.assertEqual(guess_time_type(datetime.time(14, 30)), datetime.time(14, 30))
-        self.assertEqual(guess_time_type(datetime.time(0, 0)), datetime.time(0, 0))
 
-    def test_edge_cases(self):
-        self.assertEqual(guess_time_type("11:59 PM"), datetime.time(23, 59))
-        self.assertEqual(guess_time_type("12:01 AM"), datetime.time(0, 1))
+class TestDateTimeGuessing(TestCase):
+    def test_valid_inputs(self):
+        for time_input, expected_time in VALID_TIMES:
+            with self.subTest(time=time_input):
+                self.assertEqual(guess_time_type(time_input), expected_time)
 
     def test_invalid_inputs(self):
-        with self.assertRaises(utils.InvalidTimeError):
-            guess_time_type("25:00")
-        with self.assertRaises(utils.InvalidTimeError):
-            guess_time_type("14:60")
-        with self.assertRaises(utils.InvalidTimeError):
-            guess_time_type("2:30 ZM")
-        with self.assertRaises(utils.InvalidTimeError):
-            guess_time_type([14, 30, 0])
-        with self.assertRaises(utils.InvalidTimeError):
-            guess_time_type([14])
-        with self.assertRaises(utils.InvalidTimeError):
-            guess_time_type("not a time")
-
-    def test_string_variations(self):
-        self.assertEqual(guess_time_type("2:30PM"), datetime.time(14, 30))
-        self.assertEqual(guess_time_type("2:30 pm"), datetime.time(14, 30))
-        self.assertEqual(guess_time_type("02:30pm"), datetime.time(14, 30))
-
-    def test_whitespace_handling(self):
-        self.assertEqual(guess_time_type("  14:30  "), datetime.time(14, 30))
-        self.assertEqual(guess_time_type("2:30 PM  "), datetime.time(14, 30))
+        for time_input in INVALID_TIMES:
+            with self.subTest(time=time_input):
+                with self.assertRaises(utils.InvalidTimeError):
+                    guess_time_type(time_input)
+
+    def test_repeated_strings_are_parsed_once(self):
+        self.assertIs(guess_time_type("2:30 PM"), guess_time_type("2:30 PM"))
 
 
 class TestGuessDateType(TestCase):
@@ -178,6 +181,10 @@ class TestGuessDateType(TestCase):
             guess_date_type("2023/05/15")
         with self.assertRaises(utils.InvalidDateError):
             guess_date_type("15-05-2023")
+        with self.assertRaises(utils.InvalidDateError):
+            guess_date_type("2023-00-15")  # ISO-like, but month out of range
+        with self.assertRaises(utils.InvalidDateError):
+            guess_date_type("2023-02-30")  # ISO-like, but day out of range
 
     # noinspection PyTypeChecker
     def test_invalid_types(self):
@@ -188,3 +195,6 @@ class TestGuessDateType(TestCase):
 
     def test_string_with_whitespace(self):
         self.assertEqual(guess_date_type("  2023-05-15  "), datetime.date(2023, 5, 15))
+
+    def test_repeated_strings_are_parsed_once(self):
+        self.assertIs(guess_date_type("2023-05-15"), guess_date_type("2023-05-15"))